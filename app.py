@@ -1,8 +1,8 @@
-import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-import yt_dlp
-from faster_whisper import WhisperModel
-from transformers import pipeline
+from backends import captions, extract_video_id, faster_whisper
+from summarizer import format_summary_pointwise, recursive_summarize, summarize_stream
 
 # Page config
 st.set_page_config(
@@ -85,107 +85,96 @@ st.markdown("<p class='note-text'>⚠️ For best performance, use videos up to
 
 if "last_summary" not in st.session_state:
     st.session_state.last_summary = ""
-if "last_audio" not in st.session_state:
-    st.session_state.last_audio = None
-
-
-# Load models
-
-@st.cache_resource
-def load_whisper():
-    return WhisperModel("base")  # switch to "tiny" if memory is limited
-
-@st.cache_resource
-def load_summarizer():
-    return pipeline("summarization", model="sshleifer/distilbart-cnn-12-6", device=-1)
-
-whisper_model = load_whisper()
-summarizer = load_summarizer()
-
-
-# Helper functions
-
-def download_audio(youtube_url, filename="audio.webm"):
-    ydl_opts = {
-        "format": "bestaudio/best",
-        "outtmpl": filename,
-        "quiet": True,
-        "no_warnings": True,
-        "geo_bypass": True
-    }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([youtube_url])
-    return filename
-
-def transcribe_audio(audio_file):
-    segments, info = whisper_model.transcribe(audio_file)
-    text = " ".join([segment.text for segment in segments])
-    return text
-
-def chunk_text(text, max_chunk=1000):
-    import re
-    sentences = re.split(r'(?<=[.!?]) +', text)
-    chunks = []
-    cur = ""
-    for s in sentences:
-        if len(cur) + len(s) + 1 <= max_chunk:
-            cur += (s + " ")
-        else:
-            chunks.append(cur.strip())
-            cur = s + " "
-    if cur.strip():
-        chunks.append(cur.strip())
-    return chunks
-
-def recursive_summarize(text):
-    chunks = chunk_text(text, max_chunk=2000)
-    summaries = []
-    progress_bar = st.progress(0)
-    for i, chunk in enumerate(chunks):
-        summary = summarizer(chunk, max_length=150, min_length=50, do_sample=False)[0]['summary_text']
-        summaries.append(summary)
-        progress_bar.progress((i + 1) / len(chunks))
-    combined_summary = " ".join(summaries)
-    if len(combined_summary) > 3000:
-        chunks2 = chunk_text(combined_summary, max_chunk=2000)
-        summaries2 = []
-        for c in chunks2:
-            summaries2.append(summarizer(c, max_length=150, min_length=50, do_sample=False)[0]['summary_text'])
-        combined_summary = " ".join(summaries2)
-    return combined_summary
-
-def format_summary_pointwise(summary_text):
-    import re
-    points = re.split(r'(?<=[.!?]) +', summary_text)
-    formatted = "\n".join([f"• {point.strip()}" for point in points if point.strip()])
-    return formatted
+
+
+# Transcription strategies
+
+def summarize_with_captions(youtube_url, on_progress):
+    transcript_text = captions.get_transcript(youtube_url)
+    if not transcript_text:
+        return None
+    return recursive_summarize(transcript_text, on_progress)
+
+def summarize_with_whisper(youtube_url, on_progress):
+    # A cached transcript needs neither the audio nor the model
+    transcript_text = faster_whisper.read_transcript(youtube_url)
+    if transcript_text is not None:
+        return recursive_summarize(transcript_text, on_progress)
+    # Load on the script thread before the warmup thread uses it
+    faster_whisper.load_whisper()
+    # Warm up Whisper in the background while the download runs
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        warmup = executor.submit(faster_whisper.warmup_whisper)
+        audio_file = faster_whisper.download_audio(youtube_url)
+        warmup.result()
+    if not audio_file:
+        raise RuntimeError("Cannot download this video. It may be restricted in your region or blocked by YouTube.")
+    # Summarize while Whisper is still decoding
+    return summarize_stream(faster_whisper.iter_segments(audio_file, on_progress))
+
+# Each strategy is tried in order until one returns a summary
+TRANSCRIBERS = {
+    "YouTube captions, Whisper fallback": [summarize_with_captions, summarize_with_whisper],
+    "Whisper": [summarize_with_whisper],
+    "YouTube captions": [summarize_with_captions],
+}
+
+def summarize_video(video_id, transcriber, on_progress):
+    youtube_url = f"https://www.youtube.com/watch?v={video_id}"
+    for summarize in TRANSCRIBERS[transcriber]:
+        summary_text = summarize(youtube_url, on_progress)
+        if summary_text:
+            return summary_text
+    raise RuntimeError("Could not get a transcript for this video.")
+
+
+# Summary cache
+
+SUMMARY_TTL = 24 * 60 * 60
+SUMMARY_MAX_ENTRIES = 32
+
+# Not st.cache_data, which cannot drive the progress bar
+@st.cache_resource(show_spinner=False)
+def summary_cache():
+    return {}
+
+def cached_summary(key):
+    entry = summary_cache().get(key)
+    if entry is None or time.time() - entry[0] > SUMMARY_TTL:
+        return None
+    return entry[1]
+
+def cache_summary(key, summary_text):
+    cache = summary_cache()
+    # Re-insert so the oldest entries come first
+    cache.pop(key, None)
+    cache[key] = (time.time(), summary_text)
+    for old_key in list(cache)[:-SUMMARY_MAX_ENTRIES]:
+        cache.pop(old_key, None)
 
 
 # Streamlit UI logic
 
+transcriber = st.sidebar.selectbox("🎙️ Transcriber", list(TRANSCRIBERS))
 url = st.text_input("🔗 Enter YouTube URL here:")
 
 if st.button("📝 Summarize", key="summarize"):
     if url:
         try:
             st.session_state.last_summary = ""
-            if st.session_state.last_audio:
-                try:
-                    os.remove(st.session_state.last_audio)
-                except Exception:
-                    pass
-                st.session_state.last_audio = None
-
-            with st.spinner("⏳ Downloading audio..."):
-                audio_file = download_audio(url)
-                st.session_state.last_audio = audio_file
 
-            with st.spinner("⏳ Transcribing audio..."):
-                transcript_text = transcribe_audio(audio_file)
-
-            with st.spinner("⏳ Summarizing transcript..."):
-                summary_text = recursive_summarize(transcript_text)
-                formatted_summary = format_summary_pointwise(summary_text)
+            # Keyed on the canonical video ID
+            key = (extract_video_id(url), transcriber)
+            summary_text = cached_summary(key)
+            if summary_text is None:
+                with st.spinner("⏳ Transcribing and summarizing video..."):
+                    progress_bar = st.progress(0)
+                    summary_text = summarize_video(
+                        *key,
+                        lambda done, total: progress_bar.progress(done / total),
+                    )
+                cache_summary(key, summary_text)
+            formatted_summary = format_summary_pointwise(summary_text)
 
             # Prepend "In this video, "
             if formatted_summary:
@@ -203,14 +192,6 @@ if st.button("📝 Summarize", key="summarize"):
 
             st.balloons()
 
-            # Cleanup audio
-            if st.session_state.last_audio:
-                try:
-                    os.remove(st.session_state.last_audio)
-                except Exception:
-                    pass
-                st.session_state.last_audio = None
-
         except Exception as e:
             st.error(f"❌ Something went wrong: {e}")
     else:
@@ -0,0 +1,49 @@
+import os
+import re
+import tempfile
+import time
+from urllib.parse import parse_qs, urlparse
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "yt_sum")
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+_VIDEO_ID = re.compile(r'[A-Za-z0-9_-]{11}')
+
+def extract_video_id(youtube_url):
+    parsed = urlparse(youtube_url)
+    video_id = parse_qs(parsed.query).get("v", [parsed.path.rstrip("/").split("/")[-1]])[0]
+    # The ID names cache files, so validate it
+    if not _VIDEO_ID.fullmatch(video_id):
+        raise ValueError("Not a valid YouTube video URL.")
+    return video_id
+
+def write_cache_file(path, text):
+    # Atomic write via rename
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def touch_cache_file(path):
+    # mtime is the last-used time for trim_cache
+    os.utime(path)
+
+def trim_cache():
+    # LRU eviction by age, then by size; directories are kept
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.is_file():
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    cutoff = time.time() - CACHE_MAX_AGE
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
@@ -0,0 +1,62 @@
+import glob
+import html
+import os
+import re
+import tempfile
+
+from backends import CACHE_DIR, extract_video_id, touch_cache_file, write_cache_file
+
+_VTT_SKIP = re.compile(r'^(WEBVTT|Kind:|Language:|NOTE)|-->')
+_VTT_TAG = re.compile(r'<[^>]+>')
+
+def vtt_to_text(vtt):
+    lines = []
+    for line in vtt.splitlines():
+        if _VTT_SKIP.search(line):
+            continue
+        line = html.unescape(_VTT_TAG.sub("", line)).strip()
+        # Auto-generated captions repeat the previous cue's line as they scroll
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+    return " ".join(lines)
+
+def get_transcript(youtube_url):
+    # English captions via yt_dlp; None when the video has none
+    import yt_dlp
+
+    video_id = extract_video_id(youtube_url)
+    transcript_file = os.path.join(CACHE_DIR, f"{video_id}.captions.txt")
+    if os.path.exists(transcript_file):
+        touch_cache_file(transcript_file)
+        with open(transcript_file, encoding="utf-8") as f:
+            return f.read()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Per-request download directory
+    with tempfile.TemporaryDirectory(dir=CACHE_DIR) as download_dir:
+        ydl_opts = {
+            "skip_download": True,
+            "writesubtitles": True,
+            "writeautomaticsub": True,
+            "subtitlesformat": "vtt",
+            "subtitleslangs": ["en", "en-.*"],
+            "outtmpl": os.path.join(download_dir, "captions"),
+            "quiet": True,
+            "no_warnings": True,
+            "geo_bypass": True
+        }
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([youtube_url])
+        except yt_dlp.utils.DownloadError:
+            return None
+        # Prefer plain "en" over regional tracks
+        vtt_files = sorted(glob.glob(os.path.join(download_dir, "captions.*.vtt")))
+        if not vtt_files:
+            return None
+        vtt_file = min(vtt_files, key=lambda path: not path.endswith(".en.vtt"))
+        with open(vtt_file, encoding="utf-8") as f:
+            text = vtt_to_text(f.read())
+    if not text:
+        return None
+    write_cache_file(transcript_file, text)
+    return text
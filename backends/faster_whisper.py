@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+import streamlit as st
+
+from backends import CACHE_DIR, extract_video_id, touch_cache_file, trim_cache, write_cache_file
+
+@st.cache_resource(show_spinner=False)
+def load_whisper():
+    from faster_whisper import WhisperModel
+
+    # int8 on CPU
+    return WhisperModel(
+        "base",  # switch to "tiny" if memory is limited
+        device="cpu",
+        compute_type="int8",
+        cpu_threads=os.cpu_count(),
+        num_workers=1,
+    )
+
+@st.cache_resource(show_spinner=False)
+def warmup_whisper():
+    import numpy as np
+
+    # Decode a second of silence once to warm up CTranslate2
+    segments, info = load_whisper().transcribe(np.zeros(16000, dtype=np.float32), beam_size=1, language="en")
+    for _ in segments:
+        pass
+
+def download_audio(youtube_url):
+    # Cached per video ID; None when YouTube refuses the download
+    import yt_dlp
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    filename = os.path.join(CACHE_DIR, f"{extract_video_id(youtube_url)}.webm")
+    if os.path.exists(filename):
+        touch_cache_file(filename)
+        return filename
+    # Download into a temp directory and publish atomically
+    with tempfile.TemporaryDirectory(dir=CACHE_DIR) as download_dir:
+        ydl_opts = {
+            "format": "bestaudio/best",
+            "outtmpl": os.path.join(download_dir, "audio.webm"),
+            "quiet": True,
+            "no_warnings": True,
+            "geo_bypass": True
+        }
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([youtube_url])
+        except yt_dlp.utils.DownloadError:
+            return None
+        os.replace(ydl_opts["outtmpl"], filename)
+    # yt_dlp sets the upload date as mtime
+    touch_cache_file(filename)
+    trim_cache()
+    return filename
+
+def read_transcript(youtube_url):
+    # By video ID, so it works after the audio was evicted
+    transcript_file = os.path.join(CACHE_DIR, f"{extract_video_id(youtube_url)}.txt")
+    if not os.path.exists(transcript_file):
+        return None
+    touch_cache_file(transcript_file)
+    with open(transcript_file, encoding="utf-8") as f:
+        return f.read()
+
+def iter_segments(audio_file, on_progress=None):
+    # Yields segment text; the transcript is cached once decoding finishes
+    segments, info = load_whisper().transcribe(
+        audio_file,
+        beam_size=1,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
+        condition_on_previous_text=False,
+        language="en",
+        # Only segment text is used
+        without_timestamps=True,
+        word_timestamps=False,
+        chunk_length=30,
+    )
+    texts = []
+    for segment in segments:
+        texts.append(segment.text)
+        if on_progress is not None and info.duration:
+            on_progress(min(segment.end, info.duration), info.duration)
+        yield segment.text
+    write_cache_file(os.path.splitext(audio_file)[0] + ".txt", "".join(texts).strip())
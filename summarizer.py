@@ -0,0 +1,222 @@
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+
+from backends import CACHE_DIR
+
+SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
+ONNX_MODEL_DIR = os.path.join(CACHE_DIR, "distilbart-cnn-12-6-fused-int8")
+ONNX_FILES = ("encoder_model", "decoder_model", "decoder_with_past_model")
+SUMMARY_WORKERS = max(1, min(4, os.cpu_count() // 2))
+# ONNX Runtime threads while Whisper is decoding
+STREAM_THREADS = max(1, os.cpu_count() // 4)
+# Passes over at most this many chunks are final and use beam search
+FINAL_PASS_CHUNKS = 4
+
+_SENT_SPLIT = re.compile(r'(?<=[.!?]) +')
+
+def export_summarizer():
+    # One-off ONNX export, fusion and int8 quantization
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTOptimizer, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    with tempfile.TemporaryDirectory(dir=CACHE_DIR) as export_dir:
+        # use_cache also exports the decoder-with-past graph
+        model = ORTModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL, export=True, use_cache=True)
+        # Fuse attention, LayerNorm and GELU before quantizing
+        optimized_dir = os.path.join(export_dir, "optimized")
+        ORTOptimizer.from_pretrained(model).optimize(
+            save_dir=optimized_dir,
+            optimization_config=OptimizationConfig(optimization_level=2),
+        )
+        quantized_dir = os.path.join(export_dir, "int8")
+        for name in ONNX_FILES:
+            quantizer = ORTQuantizer.from_pretrained(optimized_dir, file_name=f"{name}_optimized.onnx")
+            quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+        model.config.save_pretrained(quantized_dir)
+        model.generation_config.save_pretrained(quantized_dir)
+        # Publish only a complete export
+        os.replace(quantized_dir, ONNX_MODEL_DIR)
+
+@st.cache_resource(show_spinner=False)
+def load_tokenizer():
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(SUMMARIZER_MODEL)
+
+# Cached per thread count; 0 means ONNX Runtime's default
+@st.cache_resource(show_spinner=False)
+def load_summarizer(threads):
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = threads
+    if not os.path.isdir(ONNX_MODEL_DIR):
+        export_summarizer()
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        ONNX_MODEL_DIR,
+        encoder_file_name="encoder_model_optimized_quantized.onnx",
+        decoder_file_name="decoder_model_optimized_quantized.onnx",
+        decoder_with_past_file_name="decoder_with_past_model_optimized_quantized.onnx",
+        use_cache=True,
+        session_options=session_options,
+    )
+    return load_tokenizer(), model
+
+def iter_chunks(pieces, max_chunk=1000):
+    # max_chunk counts summarizer tokens, so each chunk fits BART's 1024-token window
+    tokenizer = load_tokenizer()
+    pieces = iter(pieces)
+    cur = []
+    cur_len = 0
+    tail = ""
+    tail_limit = max_chunk
+    while True:
+        piece = next(pieces, None)
+        sentences = [s for s in _SENT_SPLIT.split((piece or "").strip()) if s]
+        # Continue the unfinished sentence unless it already ended
+        if tail and sentences and not tail.endswith((".", "!", "?")):
+            sentences[0] = f"{tail} {sentences[0]}"
+        elif tail:
+            sentences.insert(0, tail)
+        # The last sentence may continue in the next piece
+        tail = sentences.pop() if piece is not None and sentences else ""
+        if sentences:
+            tail_limit = max_chunk
+        token_ids = tokenizer(sentences, add_special_tokens=False)["input_ids"] if sentences else []
+        for s, ids in zip(sentences, token_ids):
+            s_len = len(ids) + 1
+            if s_len > max_chunk:
+                # Split runaway sentences by tokens
+                if cur:
+                    yield " ".join(cur)
+                    cur = []
+                    cur_len = 0
+                step = max_chunk - 1
+                for i in range(0, len(ids), step):
+                    yield tokenizer.decode(ids[i:i + step])
+                continue
+            if cur_len + s_len > max_chunk and cur:
+                yield " ".join(cur)
+                cur = []
+                cur_len = 0
+            cur.append(s)
+            cur_len += s_len
+        # Emit unpunctuated text in full windows
+        if len(tail) > tail_limit:
+            ids = tokenizer(tail, add_special_tokens=False)["input_ids"]
+            step = max_chunk - 1
+            full = len(ids) - len(ids) % step
+            if full:
+                if cur:
+                    yield " ".join(cur)
+                    cur = []
+                    cur_len = 0
+                for i in range(0, full, step):
+                    yield tokenizer.decode(ids[i:i + step])
+                tail = tokenizer.decode(ids[full:])
+            # Each token spans at least one character
+            tail_limit = len(tail) + step - (len(ids) - full)
+        if piece is None:
+            break
+    if cur:
+        yield " ".join(cur)
+
+def chunk_text(text, max_chunk=1000):
+    return list(iter_chunks([text], max_chunk))
+
+def summarize_batch(tokenizer, model, batch, final=False):
+    # Call generate directly instead of the pipeline
+    inputs = tokenizer(
+        batch,
+        return_tensors="pt",
+        padding=True,
+        truncation=True,
+        max_length=1024,
+    )
+    # Greedy for intermediate passes, beam search for the final one
+    output_ids = model.generate(
+        **inputs,
+        num_beams=4 if final else 1,
+        max_new_tokens=150 if final else 100,
+        min_new_tokens=50,
+        no_repeat_ngram_size=3,
+    )
+    return tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+
+def summarize_chunks(chunks, final=False, on_progress=None):
+    # on_progress(done, total) runs on the calling thread
+    if not chunks:
+        return []
+    # Load on the calling thread and pass the model to the workers
+    tokenizer, model = load_summarizer(0)
+    # Small batches keep padding cheap
+    batch_size = min(4, -(-len(chunks) // SUMMARY_WORKERS))
+    batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+    # ONNX Runtime releases the GIL, so batches run concurrently
+    with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(batches))) as executor:
+        futures = [executor.submit(summarize_batch, tokenizer, model, batch, final) for batch in batches]
+        if on_progress is not None:
+            for done, _ in enumerate(as_completed(futures), 1):
+                on_progress(done, len(futures))
+        return [summary for future in futures for summary in future.result()]
+
+def summarize_pass(chunks, on_progress=None):
+    # Returns the summary and whether it used beam search
+    final = len(chunks) <= FINAL_PASS_CHUNKS
+    return " ".join(summarize_chunks(chunks, final, on_progress)), final
+
+def reduce_summary(chunks, combined_summary, final, source_len):
+    # Reduce while too long and still shrinking
+    prev_len = source_len
+    while len(combined_summary) > 3000 and len(combined_summary) < prev_len:
+        prev_len = len(combined_summary)
+        chunks = chunk_text(combined_summary)
+        combined_summary, final = summarize_pass(chunks)
+    if not final:
+        # Re-decode a greedy last pass with beam search
+        combined_summary = " ".join(summarize_chunks(chunks, final=True))
+    return combined_summary
+
+def recursive_summarize(text, on_progress=None):
+    # Progress covers the first pass
+    chunks = chunk_text(text)
+    summary, final = summarize_pass(chunks, on_progress)
+    return reduce_summary(chunks, summary, final, len(text))
+
+def summarize_stream(pieces):
+    # Summarize chunks while the pieces are still being produced
+    text_len = 0
+    chunks = []
+    held = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for chunk in iter_chunks(pieces):
+            text_len += len(chunk) + 1
+            chunks.append(chunk)
+            held.append(chunk)
+            # Hold chunks until this can no longer be the final pass
+            if futures or len(held) > FINAL_PASS_CHUNKS:
+                # Capped pool while the producer is still running
+                tokenizer, model = load_summarizer(STREAM_THREADS)
+                futures.extend(executor.submit(summarize_batch, tokenizer, model, [chunk]) for chunk in held)
+                held = []
+        if futures:
+            tokenizer, model = load_summarizer(0)
+            futures.extend(executor.submit(summarize_batch, tokenizer, model, [chunk]) for chunk in held)
+            summaries = [summary for future in futures for summary in future.result()]
+        else:
+            summaries = summarize_chunks(held, final=True)
+    # Streamed chunks were decoded greedily
+    return reduce_summary(chunks, " ".join(summaries), not futures, text_len)
+
+def format_summary_pointwise(summary_text):
+    points = (point.strip() for point in _SENT_SPLIT.split(summary_text))
+    formatted = "\n".join(f"• {point}" for point in points if point)
+    return formatted